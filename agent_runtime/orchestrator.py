@@ -5,7 +5,7 @@ Hybrid implementation that tries Path A (memory injection) first,
 with automatic fallback to Path B (physical blocking) if injection fails.
 """
 
-from typing import Dict, Any, List, Set, Optional
+from typing import Dict, Any, FrozenSet, List, Set, Optional
 from dataclasses import dataclass
 from agent_runtime.state import AgentState
 from agent_runtime.tool_registry import (
@@ -336,6 +336,12 @@ class GatedToolCallingAgent:
     TODO: Implement once smolagents source is studied.
     """
     
+    # Tools that would end the task without proper completion
+    _FINALIZATION_TOOLS: FrozenSet[str] = frozenset({
+        # Add actual finalization tool names here
+        # Example: "final_answer", "complete_task", etc.
+    })
+    
     def __init__(self, base_agent, state):
         """
         Wrapper around base agent that enforces gates.
@@ -347,6 +353,7 @@ class GatedToolCallingAgent:
         self.base_agent = base_agent
         self.state = state
         self.gate_tracker = GateTracker(state)
+        self._gates_passed = False  # Gates never un-pass within a task
         
         # Copy relevant attributes
         self.tools = base_agent.tools
@@ -358,6 +365,7 @@ class GatedToolCallingAgent:
         """
         # Set task in state
         self.state.task = task
+        self._gates_passed = False
         
         # Start the agent loop
         return self._run_with_gates(task)
@@ -379,19 +387,18 @@ class GatedToolCallingAgent:
         
         Returns True if tool should be blocked, False otherwise.
         """
-        # Identify finalization tools
-        # These are tools that would end the task without proper completion
-        FINALIZATION_TOOLS = {
-            # Add actual finalization tool names here
-            # Example: "final_answer", "complete_task", etc.
-        }
+        if tool_name not in self._FINALIZATION_TOOLS:
+            return False
         
-        if tool_name in FINALIZATION_TOOLS:
-            status = self.gate_tracker.evaluate_gates()
-            if not status.all_passed():
-                # Block this tool execution
-                return True
+        if self._gates_passed:
+            return False
+        
+        status = self.gate_tracker.evaluate_gates()
+        if not status.all_passed():
+            # Block this tool execution
+            return True
         
+        self._gates_passed = True
         return False
     
     def _get_blocking_response(self, status: GateStatus) -> dict:
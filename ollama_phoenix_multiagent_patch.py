@@ -51,7 +51,7 @@ from patch_tools import ProposePatchTool, ApplyPatchTool, ApprovalGate, PatchPro
 from openinference.instrumentation.smolagents import SmolagentsInstrumentor
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
 import re
 import requests
 from markdownify import markdownify
@@ -68,7 +68,14 @@ def setup_phoenix_host():
     """Set up Phoenix telemetry on the host"""
     endpoint = "http://localhost:6006/v1/traces"
     tracer_provider = TracerProvider()
-    tracer_provider.add_span_processor(SimpleSpanProcessor(OTLPSpanExporter(endpoint)))
+    # Export from a background thread so tool calls don't wait on the OTLP round-trip
+    tracer_provider.add_span_processor(BatchSpanProcessor(
+        OTLPSpanExporter(endpoint),
+        max_queue_size=8192,
+        schedule_delay_millis=2000,
+        max_export_batch_size=512,
+        export_timeout_millis=5000,  # keep exit-time flush short if Phoenix is down
+    ))
     SmolagentsInstrumentor().instrument(tracer_provider=tracer_provider)
     print("✓ Phoenix telemetry enabled on host")
 
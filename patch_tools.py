@@ -21,8 +21,6 @@ Usage:
 from dataclasses import dataclass, asdict
 from typing import Optional, Any
 import subprocess
-import tempfile
-import os
 import difflib
 
 
@@ -159,25 +157,18 @@ class ApplyPatchTool:
         ApplyResult with success status
     """
     
-    def _write_patch_file(self, diff: str) -> str:
-        """Write diff to temporary file for patch command."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.patch') as f:
-            f.write(diff)
-            return f.name
-    
-    def _apply_with_patch_command(self, patch_file: str, dry_run: bool) -> tuple[bool, str]:
-        """Use system patch command to apply diff."""
+    def _apply_with_patch_command(self, diff: str, dry_run: bool) -> tuple[bool, str]:
+        """Use system patch command to apply diff (piped on stdin)."""
         cmd = ['patch', '-p1']
         if dry_run:
             cmd.append('--dry-run')
         
-        with open(patch_file, 'r') as f:
-            result = subprocess.run(
-                cmd,
-                stdin=f,
-                capture_output=True,
-                text=True
-            )
+        result = subprocess.run(
+            cmd,
+            input=diff,
+            capture_output=True,
+            text=True
+        )
         
         return (result.returncode == 0, result.stderr if result.returncode != 0 else "")
     
@@ -192,19 +183,14 @@ class ApplyPatchTool:
         Returns:
             ApplyResult with success status and files changed
         """
-        patch_file = self._write_patch_file(patch.diff)
+        success, error = self._apply_with_patch_command(patch.diff, dry_run)
         
-        try:
-            success, error = self._apply_with_patch_command(patch_file, dry_run)
-            
-            return ApplyResult(
-                success=success,
-                files_changed=[patch.base_ref] if success else [],
-                error=error if not success else None,
-                patch_id=patch.patch_id
-            )
-        finally:
-            os.unlink(patch_file)
+        return ApplyResult(
+            success=success,
+            files_changed=[patch.base_ref] if success else [],
+            error=error if not success else None,
+            patch_id=patch.patch_id
+        )
 
 
 class ApprovalGate:
@@ -23,12 +23,38 @@ from .tool_registry import (
     PATCH_TOOLS,
     VERIFY_TOOLS,
     PROGRESS_TOOLS,
-    ALL_TOOLS
+    ALL_TOOLS,
+    TOOL_BITS,
+    TOOL_BIT_SEARCH,
+    TOOL_BIT_READ,
+    TOOL_BIT_PATCH,
+    TOOL_BIT_VERIFY,
+    TOOL_BIT_DISCOVERY,
+    TOOL_BIT_PROGRESS
 )
 
 # Re-export existing functionality
 from .state import AgentState
 from .config import Config
 from .approval import ApprovalStore, set_approval_store
-from .instrumentation import wrap_tools_with_instrumentation, setup_phoenix_telemetry
-from .run import build_agent, run_task, interactive_cli
+
+# Instrumentation and the agent builder pull in smolagents/LiteLLM, so they
+# are imported on first access. Light modules (state, policy, tools) stay cheap.
+_LAZY_EXPORTS = {
+    "wrap_tools_with_instrumentation": ".instrumentation",
+    "setup_phoenix_telemetry": ".instrumentation",
+    "build_agent": ".run",
+    "run_task": ".run",
+    "interactive_cli": ".run",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
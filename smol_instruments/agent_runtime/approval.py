@@ -134,19 +134,21 @@ class ApprovalStore:
     
     def _console_approval(self, request: ApprovalRequest) -> Approval:
         """Default console-based approval for any request type."""
-        print("\n" + "=" * 70)
+        # Build the whole banner first so it is written in one call
+        lines = ["\n" + "=" * 70]
         if request.kind == "command":
-            print("⚠️  COMMAND APPROVAL REQUEST")
+            lines.append("⚠️  COMMAND APPROVAL REQUEST")
         else:
-            print("🔧 PATCH APPROVAL REQUEST")
-        print("=" * 70)
-        print(f"ID: {request.request_id}")
-        print(f"Summary: {request.summary}")
+            lines.append("🔧 PATCH APPROVAL REQUEST")
+        lines.append("=" * 70)
+        lines.append(f"ID: {request.request_id}")
+        lines.append(f"Summary: {request.summary}")
         if request.source_file:
-            print(f"File: {request.source_file}")
-        print(f"\n{request.kind.title()}:")
-        print(request.details)
-        print("=" * 70)
+            lines.append(f"File: {request.source_file}")
+        lines.append(f"\n{request.kind.title()}:")
+        lines.append(request.details)
+        lines.append("=" * 70)
+        print("\n".join(lines))
         
         while True:
             choice = input("\nApprove? [y/n/feedback]: ").strip().lower()
@@ -75,7 +75,9 @@ def _instrument_tool(tool: Tool, state: AgentState, validation_config: Dict):
         bound_args.apply_defaults()
         call_kwargs = bound_args.arguments
         
-        args_hash = _compute_args_hash(call_kwargs)
+        # Serialize once; the hash, size and details attributes all reuse it
+        args_json = json.dumps(call_kwargs, sort_keys=True, default=str)
+        args_hash = _compute_args_hash(args_json)
         
         with tracer.start_as_current_span(f"tool_wrapped.{tool.name}") as span:
             start_time = time.time()
@@ -83,8 +85,8 @@ def _instrument_tool(tool: Tool, state: AgentState, validation_config: Dict):
             # Set comprehensive span attributes
             span.set_attribute("tool.name", tool.name)
             span.set_attribute("tool.args.hash", args_hash)
-            span.set_attribute("tool.args.size", len(json.dumps(call_kwargs, default=str)))
-            span.set_attribute("tool.args.details", json.dumps(call_kwargs, default=str))
+            span.set_attribute("tool.args.size", len(args_json))
+            span.set_attribute("tool.args.details", args_json)
             
             # Add tool-specific attributes for better filtering
             if tool.name in ["read_file", "read_file_snippet"]:
@@ -210,10 +212,9 @@ def _instrument_tool(tool: Tool, state: AgentState, validation_config: Dict):
 
 # Helper functions
 
-def _compute_args_hash(kwargs: Dict) -> str:
-    """Compute stable hash of arguments for tracing."""
-    sorted_args = json.dumps(kwargs, sort_keys=True, default=str)
-    return hashlib.sha256(sorted_args.encode()).hexdigest()[:8]
+def _compute_args_hash(args_json: str) -> str:
+    """Compute stable hash of key-sorted serialized arguments for tracing."""
+    return hashlib.blake2b(args_json.encode(), digest_size=4).hexdigest()
 
 
 def _validate_inputs(tool_name: str, kwargs: Dict) -> Optional[Dict[str, Any]]:
@@ -305,7 +306,7 @@ def _truncate_result(result: Any) -> Any:
 
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
 
 
 def setup_phoenix_telemetry(endpoint: Optional[str] = None, use_batch: bool = True):
@@ -314,7 +315,8 @@ def setup_phoenix_telemetry(endpoint: Optional[str] = None, use_batch: bool = Tr
     
     Args:
         endpoint: Phoenix OTLP endpoint (defaults to Config.PHOENIX_ENDPOINT)
-        use_batch: Whether to use BatchSpanProcessor
+        use_batch: Whether to use BatchSpanProcessor (background export)
+            instead of SimpleSpanProcessor
     """
     if endpoint is None:
         endpoint = Config.PHOENIX_ENDPOINT
@@ -322,7 +324,7 @@ def setup_phoenix_telemetry(endpoint: Optional[str] = None, use_batch: bool = Tr
     tracer_provider = TracerProvider()
     
     exporter = OTLPSpanExporter(endpoint)
-    processor = BatchSpanProcessor(exporter) if use_batch else exporter
+    processor = BatchSpanProcessor(exporter) if use_batch else SimpleSpanProcessor(exporter)
     
     tracer_provider.add_span_processor(processor)
     trace.set_tracer_provider(tracer_provider)
@@ -5,20 +5,79 @@ Hybrid implementation that tries Path A (memory injection) first,
 with automatic fallback to Path B (physical blocking) if injection fails.
 """
 
-from typing import Dict, Any, List, Set, Optional
-from dataclasses import dataclass
+import re
+from typing import Dict, Any, Callable, Set, Optional
+from dataclasses import dataclass, replace
 from .state import AgentState
 from .tool_registry import (
-    DISCOVERY_TOOLS,
-    SEARCH_TOOLS,
-    READ_TOOLS,
-    PATCH_TOOLS,
-    VERIFY_TOOLS,
-    PROGRESS_TOOLS,
+    TOOL_BITS,
+    TOOL_BIT_SEARCH,
+    TOOL_BIT_READ,
+    TOOL_BIT_PATCH,
+    TOOL_BIT_VERIFY,
+    TOOL_BIT_PROGRESS,
 )
 
 
-@dataclass
+# Warning text (static parts built once at import)
+_CRITICAL_TEMPLATE = (
+    "🚫 CRITICAL (step %d): You are stuck.\n"
+    "\n"
+    "You MUST use a progress tool NOW:\n"
+    "  • rg_search - search for relevant code\n"
+    "  • read_file - examine a specific file\n"
+    "  • propose_patch_unified - create a patch\n"
+    "  • run_tests - verify changes\n"
+    "%s\n"
+    "\n"
+    "DO NOT call discovery tools again (repo_info, list_files)."
+)
+
+_INITIAL_WARNING = (
+    "⚠ WARNING: You have not made progress yet.\n"
+    "\n"
+    "Next, you must:\n"
+    "1. Use 'rg_search' to find relevant code\n"
+    "2. Use 'read_file' to examine files\n"
+    "3. Use 'propose_patch_unified' to create changes\n"
+    "4. Use 'run_tests' or 'run_cmd' to verify\n"
+    "\n"
+    "Do not finalize yet."
+)
+
+_INCOMPLETE_TEMPLATE = (
+    "⚠ WARNING (step %d): Task incomplete.\n"
+    "\n"
+    "Still need to:\n"
+    "%s\n"
+    "\n"
+    "Continue working. DO NOT finalize."
+)
+
+# Task keywords -> suggested search
+_PHOENIX_HINT = "\nSuggested: rg_search(pattern='phoenix|trace|span')"
+_TEST_HINT = "\nSuggested: rg_search(pattern='test.*')"
+_ERROR_HINT = "\nSuggested: rg_search(pattern='error|exception')"
+
+_HINT_MAP = {
+    "tracing": _PHOENIX_HINT,
+    "phoenix": _PHOENIX_HINT,
+    "test": _TEST_HINT,
+    "bug": _ERROR_HINT,
+    "error": _ERROR_HINT,
+}
+_HINT_PRIORITY = (_PHOENIX_HINT, _TEST_HINT, _ERROR_HINT)
+# ASCII-only case folding, so every match lowercases to a _HINT_MAP key
+_HINT_RE = re.compile("|".join(_HINT_MAP), re.IGNORECASE | re.ASCII)
+
+
+def _task_hint(task: str) -> str:
+    """Pick a search suggestion for the task (single regex scan)."""
+    found = {_HINT_MAP[m.lower()] for m in _HINT_RE.findall(task)}
+    return next((hint for hint in _HINT_PRIORITY if hint in found), "")
+
+
+@dataclass(slots=True)
 class GateStatus:
     """Track status of all gates."""
     understanding: bool = False
@@ -77,30 +136,83 @@ class GateTracker:
     
     def __init__(self, state: AgentState):
         self.state = state
-        self.warnings_issued: List[str] = []
+        self.warnings_issued: Set[str] = set()
         self.last_warning_step: int = 0
+        
+        # Incremental tool usage evidence (only new steps are scanned)
+        self._last_scanned: int = 0
+        self._evidence_mask: int = 0  # OR of TOOL_BITS for tools used
+        
+        # What the cache was built from, to detect steps replaced for a new task
+        self._scanned_task: Optional[str] = None
+        self._first_step = None
+        
+        # Readiness never regresses within a task, so the first ready status is reused
+        self._sealed_status: Optional[GateStatus] = None
+    
+    def _steps_replaced(self) -> bool:
+        """Check if the steps scanned so far no longer belong to the current task."""
+        if not self._last_scanned:
+            return False
+        steps = self.state.steps
+        return (
+            len(steps) < self._last_scanned or
+            steps[0] is not self._first_step or
+            self.state.task != self._scanned_task
+        )
+    
+    def _scan_new_steps(self) -> None:
+        """Fold steps appended since the last evaluation into the evidence cache."""
+        steps = self.state.steps
+        if self._steps_replaced():
+            # Steps were cleared (new task) - start over
+            self._last_scanned = 0
+            self._evidence_mask = 0
+            self._sealed_status = None
+        
+        if not self._last_scanned:
+            self._scanned_task = self.state.task
+            self._first_step = steps[0] if steps else None
+        
+        mask = self._evidence_mask
+        for s in steps[self._last_scanned:]:
+            mask |= TOOL_BITS.get(s.tool_name, 0)
+        self._evidence_mask = mask
+        self._last_scanned = len(steps)
+    
+    @property
+    def readiness_reached(self) -> bool:
+        """Check if all gates have already passed for the current task."""
+        if self._steps_replaced():
+            return False  # New task; next evaluation resets
+        return self._sealed_status is not None
     
     def evaluate_gates(self) -> GateStatus:
         """
         Evaluate all gates based on current state.
+        
+        Returns a fresh GateStatus on every call.
         """
+        self._scan_new_steps()
+        
+        if self._sealed_status is not None:
+            return replace(self._sealed_status, steps_taken=self._last_scanned)
+        
         status = GateStatus()
-        status.steps_taken = len(self.state.steps)
+        status.steps_taken = self._last_scanned
         
         # Gather tool usage evidence
-        tools_used = [s.tool_name for s in self.state.steps]
-        tools_set = set(tools_used)
+        mask = self._evidence_mask
         
-        did_search = bool(SEARCH_TOOLS & tools_set)
-        did_read = bool(READ_TOOLS & tools_set)
-        did_patch = bool(PATCH_TOOLS & tools_set)
-        did_verify = bool(VERIFY_TOOLS & tools_set)
+        did_search = bool(mask & TOOL_BIT_SEARCH)
+        did_read = bool(mask & TOOL_BIT_READ)
+        did_patch = bool(mask & TOOL_BIT_PATCH)
+        did_verify = bool(mask & TOOL_BIT_VERIFY)
         
         # Progress detection
-        progress_used = PROGRESS_TOOLS & tools_set
         no_progress_yet = (
-            len(progress_used) == 0 and 
-            len(tools_used) >= 2
+            not mask & TOOL_BIT_PROGRESS and 
+            status.steps_taken >= 2
         )
         
         # Update status evidence
@@ -132,6 +244,9 @@ class GateTracker:
             status.verification
         )
         
+        if status.readiness:
+            self._sealed_status = replace(status)
+        
         return status
     
     def get_warning_message(self, status: GateStatus) -> Optional[str]:
@@ -149,50 +264,23 @@ class GateTracker:
                 # Hard escalation
                 warning_key = "no_progress_escalated"
                 if warning_key not in self.warnings_issued:
-                    self.warnings_issued.append(warning_key)
+                    self.warnings_issued.add(warning_key)
                     self.last_warning_step = status.steps_taken
                     
                     # Extract task hint from state if available
                     task_hint = ""
                     if hasattr(self.state, 'task') and self.state.task:
                         # Suggest a search pattern based on task
-                        task_lower = self.state.task.lower()
-                        if "tracing" in task_lower or "phoenix" in task_lower:
-                            task_hint = "\nSuggested: rg_search(pattern='phoenix|trace|span')"
-                        elif "test" in task_lower:
-                            task_hint = "\nSuggested: rg_search(pattern='test.*')"
-                        elif "bug" in task_lower or "error" in task_lower:
-                            task_hint = "\nSuggested: rg_search(pattern='error|exception')"
+                        task_hint = _task_hint(self.state.task)
                     
-                    return (
-                        f"🚫 CRITICAL (step {status.steps_taken}): You are stuck.\n"
-                        "\n"
-                        "You MUST use a progress tool NOW:\n"
-                        "  • rg_search - search for relevant code\n"
-                        "  • read_file - examine a specific file\n"
-                        "  • propose_patch_unified - create a patch\n"
-                        "  • run_tests - verify changes\n"
-                        f"{task_hint}\n"
-                        "\n"
-                        "DO NOT call discovery tools again (repo_info, list_files)."
-                    )
+                    return _CRITICAL_TEMPLATE % (status.steps_taken, task_hint)
             
             # Initial warning
             warning_key = "no_progress"
             if warning_key not in self.warnings_issued:
-                self.warnings_issued.append(warning_key)
+                self.warnings_issued.add(warning_key)
                 self.last_warning_step = status.steps_taken
-                return (
-                    "⚠ WARNING: You have not made progress yet.\n"
-                    "\n"
-                    "Next, you must:\n"
-                    "1. Use 'rg_search' to find relevant code\n"
-                    "2. Use 'read_file' to examine files\n"
-                    "3. Use 'propose_patch_unified' to create changes\n"
-                    "4. Use 'run_tests' or 'run_cmd' to verify\n"
-                    "\n"
-                    "Do not finalize yet."
-                )
+                return _INITIAL_WARNING
         
         # Progressive warnings for incomplete gates (after 5 steps)
         if status.steps_taken >= 5 and not status.all_passed():
@@ -200,6 +288,11 @@ class GateTracker:
             if status.steps_taken - self.last_warning_step < 3:
                 return None
             
+            # Dedup before building the message
+            warning_key = f"step_{status.steps_taken // 3}"
+            if warning_key in self.warnings_issued:
+                return None
+            
             missing = []
             
             if not status.understanding:
@@ -215,58 +308,55 @@ class GateTracker:
                 missing.append("verify (use 'run_tests' or 'run_cmd')")
             
             if missing:
-                warning_key = f"step_{status.steps_taken // 3}"
-                if warning_key not in self.warnings_issued:
-                    self.warnings_issued.append(warning_key)
-                    self.last_warning_step = status.steps_taken
-                    
-                    return (
-                        f"⚠ WARNING (step {status.steps_taken}): Task incomplete.\n"
-                        "\n"
-                        "Still need to:\n" +
-                        "\n".join(f"  - {item}" for item in missing) +
-                        "\n\n"
-                        "Continue working. DO NOT finalize."
-                    )
+                self.warnings_issued.add(warning_key)
+                self.last_warning_step = status.steps_taken
+                
+                return _INCOMPLETE_TEMPLATE % (
+                    status.steps_taken,
+                    "\n".join(f"  - {item}" for item in missing),
+                )
         
         # All gates passed
         return None
 
 
+_UNRESOLVED = object()
+
+
+def _resolve_sink(agent) -> Optional[Callable[[Dict[str, str]], None]]:
+    """Find where injected messages go: memory list first, then logs list."""
+    memory = getattr(agent, 'memory', None)
+    if isinstance(memory, list):
+        return memory.append
+    
+    logs = getattr(agent, 'logs', None)
+    if isinstance(logs, list):
+        return logs.append
+    
+    return None
+
+
 def try_inject_message(agent, message: str, role: str = "system") -> bool:
     """
     Try to inject a message into agent memory.
     Returns True if injection successful, False otherwise.
+    
+    The sink is resolved on first use and cached on the agent as _gate_sink.
     """
     try:
-        # Strategy 1: Direct memory injection via steps
-        if hasattr(agent, 'memory') and hasattr(agent.memory, 'steps'):
-            # Import here to avoid circular imports
-            from smolagents.memory import ChatMessage, MessageRole
-            
-            # Find the last step and append to its context
-            # Or inject as a system message that will be seen
-            if hasattr(agent.memory, 'system_prompt'):
-                # Append to the memory as a tool response (most reliable)
-                pass
+        sink = getattr(agent, '_gate_sink', _UNRESOLVED)
+        if sink is _UNRESOLVED:
+            sink = _resolve_sink(agent)
+            agent._gate_sink = sink
         
-        # Strategy 2: Direct memory list injection
-        if hasattr(agent, 'memory') and isinstance(agent.memory, list):
-            agent.memory.append({
-                "role": role,
-                "content": message
-            })
-            return True
+        if sink is None:
+            return False
         
-        # Strategy 3: Try logs if memory not available
-        elif hasattr(agent, 'logs') and isinstance(agent.logs, list):
-            agent.logs.append({
-                "role": role,
-                "content": message
-            })
-            return True
-        
-        return False
+        sink({
+            "role": role,
+            "content": message
+        })
+        return True
         
     except Exception as e:
         # Log the error but don't crash
@@ -336,17 +426,18 @@ Please retry with the correct JSON format. Remember your task: {task}"""
     # Inject the recovery message
     injected = try_inject_message(agent, recovery_message, role="user")
     
-    # Console output
-    print(f"\n{'='*70}")
-    print("⚠️ PARSING ERROR DETECTED - Injecting recovery guidance")
-    print(f"{'='*70}")
-    print(f"Task: {task}")
-    print(f"Malformed output: {malformed_output[:200]}...")
+    # Console output, built first so it is written in one call
+    lines = ["\n" + "=" * 70]
+    lines.append("⚠️ PARSING ERROR DETECTED - Injecting recovery guidance")
+    lines.append("=" * 70)
+    lines.append(f"Task: {task}")
+    lines.append(f"Malformed output: {malformed_output[:200]}...")
     if injected:
-        print("✓ Recovery guidance injected into agent memory")
+        lines.append("✓ Recovery guidance injected into agent memory")
     else:
-        print("⚠ Could not inject recovery guidance")
-    print(f"{'='*70}\n")
+        lines.append("⚠ Could not inject recovery guidance")
+    lines.append("=" * 70 + "\n")
+    print("\n".join(lines))
     
     return True
 
@@ -364,13 +455,20 @@ def gate_aware_step_callback(step, agent):
         return  # Don't also show gate warnings on error steps
     
     # Get or create persisted tracker
-    if not hasattr(agent, '_gate_tracker'):
+    tracker = getattr(agent, '_gate_tracker', None)
+    if tracker is None:
+        # Whether state is attached is fixed for the agent's lifetime - decide once
+        if getattr(agent, '_gate_enabled', None) is False:
+            return
         state = getattr(agent, '_smol_state', None)
-        if not state:
+        agent._gate_enabled = state is not None
+        if state is None:
             return
-        agent._gate_tracker = GateTracker(state)
+        tracker = agent._gate_tracker = GateTracker(state)
+    
+    if tracker.readiness_reached:
+        return  # All gates passed, nothing left to warn about
     
-    tracker = agent._gate_tracker
     status = tracker.evaluate_gates()
     
     # Get warning
@@ -381,15 +479,16 @@ def gate_aware_step_callback(step, agent):
     # Inject warning into agent memory (Path A only)
     injected = try_inject_warning(agent, warning)
     
-    # Console output (always)
-    print(f"\n{'='*70}")
+    # Console output (always), written in one call
+    lines = ["\n" + "=" * 70]
     if injected:
-        print("✓ GATE WARNING INJECTED (model will see this):")
+        lines.append("✓ GATE WARNING INJECTED (model will see this):")
     else:
-        print("⚠ GATE WARNING (injection failed, but continuing):")
-    print(f"{'='*70}")
-    print(warning)
-    print(f"{'='*70}\n")
+        lines.append("⚠ GATE WARNING (injection failed, but continuing):")
+    lines.append("=" * 70)
+    lines.append(warning)
+    lines.append("=" * 70 + "\n")
+    print("\n".join(lines))
 
 
 def get_gate_status(agent) -> Optional[GateStatus]:
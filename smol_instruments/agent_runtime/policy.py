@@ -14,6 +14,19 @@ import re
 # Command Policy (NEW - enforces safety in Python, not prompts)
 # ============================================================================
 
+def _compile_any(patterns) -> re.Pattern:
+    """Compile lowercased patterns into one alternation (invalid regexes match literally)."""
+    alternatives = []
+    for pattern in patterns:
+        pattern = pattern.lower()
+        try:
+            re.compile(pattern)
+        except re.error:
+            pattern = re.escape(pattern)
+        alternatives.append(f"(?:{pattern})")
+    return re.compile("|".join(alternatives))
+
+
 class CommandAction(Enum):
     """Classification for command execution."""
     ALLOW = "allow"
@@ -85,6 +98,12 @@ class CommandPolicy:
         "chown -R",
     ]
     
+    # Derived once from the lists above so classification does a single regex scan
+    # and two tuple startswith checks instead of per-pattern lower()/search calls
+    _DANGEROUS_RE = _compile_any(DANGEROUS_PATTERNS)
+    _SAFE_PREFIXES = tuple(prefix.lower() for prefix in SAFE_PREFIXES)
+    _RISKY_PREFIXES = tuple(prefix.lower() for prefix in RISKY_PREFIXES)
+    
     @classmethod
     def classify_command(cls, cmd: str) -> CommandAction:
         """
@@ -99,25 +118,16 @@ class CommandPolicy:
         cmd_lower = cmd.lower().strip()
         
         # Check dangerous patterns first (supports both literal strings and regex)
-        for pattern in cls.DANGEROUS_PATTERNS:
-            # Try as regex first
-            try:
-                if re.search(pattern.lower(), cmd_lower):
-                    return CommandAction.DENY
-            except re.error:
-                # If not valid regex, treat as literal string
-                if pattern.lower() in cmd_lower:
-                    return CommandAction.DENY
+        if cls._DANGEROUS_RE.search(cmd_lower):
+            return CommandAction.DENY
         
         # Check safe prefixes
-        for prefix in cls.SAFE_PREFIXES:
-            if cmd_lower.startswith(prefix.lower()):
-                return CommandAction.ALLOW
+        if cmd_lower.startswith(cls._SAFE_PREFIXES):
+            return CommandAction.ALLOW
         
         # Check risky prefixes
-        for prefix in cls.RISKY_PREFIXES:
-            if cmd_lower.startswith(prefix.lower()):
-                return CommandAction.REQUIRE_APPROVAL
+        if cmd_lower.startswith(cls._RISKY_PREFIXES):
+            return CommandAction.REQUIRE_APPROVAL
         
         # Default: require approval for unknown commands
         return CommandAction.REQUIRE_APPROVAL
@@ -165,7 +165,7 @@ def build_agent(
                         if len(args) > 0:
                             prompt = args[0] if isinstance(args[0], str) else str(args[0])
                             llm_span.set_attribute("llm.prompt.length", len(prompt))
-                            llm_span.set_attribute("llm.prompt.hash", hashlib.sha256(prompt.encode()).hexdigest()[:8])
+                            llm_span.set_attribute("llm.prompt.hash", hashlib.blake2b(prompt.encode(), digest_size=4).hexdigest())
                         
                         # Make the actual LLM call
                         start_time = time.time()
@@ -178,7 +178,7 @@ def build_agent(
                             if isinstance(result, dict) and "choices" in result:
                                 completion = result["choices"][0]["message"]["content"] if "message" in result["choices"][0] else ""
                                 llm_span.set_attribute("llm.completion.length", len(completion))
-                                llm_span.set_attribute("llm.completion.hash", hashlib.sha256(completion.encode()).hexdigest()[:8])
+                                llm_span.set_attribute("llm.completion.hash", hashlib.blake2b(completion.encode(), digest_size=4).hexdigest())
                                 llm_span.set_attribute("llm.completion.preview", completion[:200] if completion else "")
                                 
                                 # Add full completion to span events for detailed analysis
@@ -6,7 +6,6 @@ without Docker. Full Docker sandbox can be added later.
 """
 
 import subprocess
-import tempfile
 from pathlib import Path
 from typing import Tuple
 from opentelemetry import trace
@@ -58,28 +57,19 @@ class SimpleSandbox:
     
     def _do_validate(self, diff: str) -> Tuple[bool, str]:
         """Perform actual validation."""
-        # Write diff to temp file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.diff', delete=False) as f:
-            f.write(diff)
-            temp_path = f.name
+        # Use git apply --check to validate (diff piped on stdin)
+        proc = subprocess.run(
+            ["git", "apply", "--check", "-"],
+            cwd=self.repo_root,
+            input=diff,
+            capture_output=True,
+            text=True
+        )
         
-        try:
-            # Use git apply --check to validate
-            proc = subprocess.run(
-                ["git", "apply", "--check", temp_path],
-                cwd=self.repo_root,
-                capture_output=True,
-                text=True
-            )
-            
-            if proc.returncode == 0:
-                return (True, "Patch applies cleanly")
-            else:
-                return (False, f"Patch does not apply: {proc.stderr}")
-        
-        finally:
-            # Clean up temp file
-            Path(temp_path).unlink(missing_ok=True)
+        if proc.returncode == 0:
+            return (True, "Patch applies cleanly")
+        else:
+            return (False, f"Patch does not apply: {proc.stderr}")
     
     def __enter__(self):
         """Context manager entry."""
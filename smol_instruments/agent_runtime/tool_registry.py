@@ -4,7 +4,7 @@ Canonical tool name registry.
 CRITICAL: Use these constants everywhere. No hardcoded strings.
 """
 
-from typing import Set, FrozenSet
+from typing import Dict, Set, FrozenSet
 
 # Discovery tools (do not count as progress)
 DISCOVERY_TOOLS: FrozenSet[str] = frozenset({
@@ -44,6 +44,26 @@ OTHER_TOOLS: FrozenSet[str] = frozenset({
 PROGRESS_TOOLS: FrozenSet[str] = SEARCH_TOOLS | READ_TOOLS | PATCH_TOOLS | VERIFY_TOOLS
 ALL_TOOLS: FrozenSet[str] = DISCOVERY_TOOLS | PROGRESS_TOOLS | OTHER_TOOLS
 
+# Category bits (one dict lookup tags a tool with all its categories)
+TOOL_BIT_SEARCH = 1
+TOOL_BIT_READ = 2
+TOOL_BIT_PATCH = 4
+TOOL_BIT_VERIFY = 8
+TOOL_BIT_DISCOVERY = 16
+TOOL_BIT_PROGRESS = TOOL_BIT_SEARCH | TOOL_BIT_READ | TOOL_BIT_PATCH | TOOL_BIT_VERIFY
+
+TOOL_BITS: Dict[str, int] = {}
+for _tools, _bit in (
+    (SEARCH_TOOLS, TOOL_BIT_SEARCH),
+    (READ_TOOLS, TOOL_BIT_READ),
+    (PATCH_TOOLS, TOOL_BIT_PATCH),
+    (VERIFY_TOOLS, TOOL_BIT_VERIFY),
+    (DISCOVERY_TOOLS, TOOL_BIT_DISCOVERY),
+):
+    for _name in _tools:
+        TOOL_BITS[_name] = TOOL_BITS.get(_name, 0) | _bit
+del _tools, _bit, _name
+
 
 def validate_tool_name(name: str) -> bool:
     """Check if tool name is registered."""
@@ -55,16 +75,22 @@ def is_progress_tool(name: str) -> bool:
     return name in PROGRESS_TOOLS
 
 
+# Prompt strings (sets are frozen, so these are built once at import)
+_TOOL_LIST_STRING = ", ".join(sorted(ALL_TOOLS))
+_DISCOVERY_TOOLS_STRING = ", ".join(sorted(DISCOVERY_TOOLS))
+_PROGRESS_TOOLS_STRING = ", ".join(sorted(PROGRESS_TOOLS))
+
+
 def get_tool_list_string() -> str:
     """Get comma-separated tool list for prompts."""
-    return ", ".join(sorted(ALL_TOOLS))
+    return _TOOL_LIST_STRING
 
 
 def get_discovery_tools_string() -> str:
     """Get comma-separated discovery tool list."""
-    return ", ".join(sorted(DISCOVERY_TOOLS))
+    return _DISCOVERY_TOOLS_STRING
 
 
 def get_progress_tools_string() -> str:
     """Get comma-separated progress tool list."""
-    return ", ".join(sorted(PROGRESS_TOOLS))
\ No newline at end of file
+    return _PROGRESS_TOOLS_STRING
@@ -1,5 +1,6 @@
 """File reading tools."""
 
+from collections import deque
 from pathlib import Path
 from smolagents import Tool
 from agent_runtime.tools.repo import RepoInfoTool
@@ -45,15 +46,18 @@ class ReadFileTool(Tool):
             }
         
         try:
-            # Read file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
+            if start_line < 1:
+                start_line = 1
             
-            total_lines = len(all_lines)
+            # Stream the file, keeping only the requested range in memory
+            selected_lines = []
+            total_lines = 0
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for total_lines, line in enumerate(f, 1):
+                    if start_line <= total_lines <= end_line:
+                        selected_lines.append(line)
             
             # Validate range
-            if start_line < 1:
-                start_line = 1
             if end_line > total_lines:
                 end_line = total_lines
             if start_line > end_line:
@@ -66,8 +70,6 @@ class ReadFileTool(Tool):
                     "message": f"Invalid range: {start_line}-{end_line} (file has {total_lines} lines)"
                 }
             
-            # Extract lines (convert to 0-indexed)
-            selected_lines = all_lines[start_line - 1:end_line]
             content = "".join(selected_lines)
             
             # Truncate if needed
@@ -134,16 +136,22 @@ class ReadFileSnippetTool(Tool):
             }
         
         try:
-            # Read file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                all_lines = f.readlines()
-            
-            # Find pattern
+            # Stream the file, keeping only the context window around the first match
+            before = deque(maxlen=max(context_lines, 0))
+            snippet_lines = []
             match_index = None
-            for i, line in enumerate(all_lines):
-                if pattern in line:
-                    match_index = i
-                    break
+            total_lines = 0
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for total_lines, line in enumerate(f, 1):
+                    if match_index is None:
+                        if pattern in line:
+                            match_index = total_lines - 1
+                            snippet_lines.extend(before)
+                            snippet_lines.append(line)
+                        else:
+                            before.append(line)
+                    elif total_lines <= match_index + context_lines + 1:
+                        snippet_lines.append(line)
             
             if match_index is None:
                 return {
@@ -154,12 +162,9 @@ class ReadFileSnippetTool(Tool):
                 }
             
             # Calculate range
-            total_lines = len(all_lines)
-            start = max(0, match_index - context_lines)
-            end = min(total_lines, match_index + context_lines + 1)
+            start = match_index - len(before)
+            end = start + len(snippet_lines)
             
-            # Extract snippet
-            snippet_lines = all_lines[start:end]
             content = "".join(snippet_lines)
             
             # Truncate if needed
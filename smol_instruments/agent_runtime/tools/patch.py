@@ -4,16 +4,20 @@ Patch tools with approval enforcement.
 FIXED: Added propose_patch_unified to work with truncated content.
 """
 
+import re
 import uuid
 import difflib
 import subprocess
-from pathlib import Path
 from smolagents import Tool
 from agent_runtime.tools.repo import RepoInfoTool
 from agent_runtime.approval import ApprovalRequest, get_approval_store
 from agent_runtime.sandbox import SimpleSandbox
 
 
+# First "--- " header line: rest of line after "a/", else first token (diff without a/ prefix)
+_OLD_PATH_RE = re.compile(r"^--- (?:a/([^\r\n]*)|[^\S\r\n]*(\S+))", re.MULTILINE)
+
+
 # ============================================================================
 # FIXED: New propose_patch_unified tool (preferred for truncated content)
 # ============================================================================
@@ -41,16 +45,11 @@ class ProposePatchUnifiedTool(Tool):
         
         # Extract file path from diff
         # Format: --- a/path/to/file.py or --- path/to/file.py
-        lines = unified_diff.splitlines()
         file_path = None
-        for line in lines:
-            if line.startswith("--- a/"):
-                file_path = line[6:]
-                break
-            elif line.startswith("--- "):
-                # Handle git diff without a/ prefix
-                file_path = line[4:].split()[0]  # First token after ---
-                break
+        match = _OLD_PATH_RE.search(unified_diff)
+        if match:
+            a_path, bare_path = match.groups()
+            file_path = a_path if a_path is not None else bare_path
         
         if not file_path:
             return {
@@ -234,41 +233,33 @@ class ApplyPatchTool(Tool):
                     "suggestion": "File may have changed since proposal. Create a new patch."
                 }
         
-        # Apply to actual repository
-        tmp = Path(root) / f".{patch_id}.diff"
-        tmp.write_text(proposal.details)
+        # Apply to actual repository (diff piped on stdin)
+        apply_proc = subprocess.run(
+            ["git", "apply", "--whitespace=nowarn", "-"],
+            cwd=root,
+            input=proposal.details,
+            capture_output=True,
+            text=True
+        )
         
-        try:
-            
-            # Apply the patch
-            apply_proc = subprocess.run(
-                ["git", "apply", "--whitespace=nowarn", str(tmp)],
-                cwd=root,
-                capture_output=True,
-                text=True
-            )
-            
-            if apply_proc.returncode != 0:
-                return {
-                    "error": "PATCH_APPLY_FAILED",
-                    "patch_id": patch_id,
-                    "stdout": apply_proc.stdout[-1000:],
-                    "stderr": apply_proc.stderr[-1000:],
-                    "message": "Patch command failed. See stdout/stderr for details."
-                }
-            
-            # Success - clean up
-            approval_store.proposals.pop(patch_id, None)
-            approval_store.approvals.pop(patch_id, None)
-            
+        if apply_proc.returncode != 0:
             return {
-                "ok": True,
+                "error": "PATCH_APPLY_FAILED",
                 "patch_id": patch_id,
-                "intent": proposal.summary,
-                "file_path": proposal.source_file,
-                "files_changed": [proposal.source_file],
-                "message": f"Patch {patch_id} applied successfully to {proposal.source_file}"
+                "stdout": apply_proc.stdout[-1000:],
+                "stderr": apply_proc.stderr[-1000:],
+                "message": "Patch command failed. See stdout/stderr for details."
             }
         
-        finally:
-            tmp.unlink(missing_ok=True)
+        # Success - clean up
+        approval_store.proposals.pop(patch_id, None)
+        approval_store.approvals.pop(patch_id, None)
+        
+        return {
+            "ok": True,
+            "patch_id": patch_id,
+            "intent": proposal.summary,
+            "file_path": proposal.source_file,
+            "files_changed": [proposal.source_file],
+            "message": f"Patch {patch_id} applied successfully to {proposal.source_file}"
+        }
@@ -46,7 +46,7 @@ class RunCmdTool(Tool):
         if action == CommandAction.REQUIRE_APPROVAL:
             # Check approval store and request approval if needed
             approval_store = get_approval_store()
-            cmd_id = f"cmd_{hashlib.sha256(cmd.encode()).hexdigest()[:10]}"
+            cmd_id = f"cmd_{hashlib.blake2b(cmd.encode(), digest_size=5).hexdigest()}"
             
             if not approval_store.is_approved(cmd_id):
                 # Request approval from user (blocks until user responds)
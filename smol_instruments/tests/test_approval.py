@@ -125,6 +125,27 @@ class TestApprovalStore:
         
         assert approval.approved is False
         assert "not found" in approval.feedback.lower()
+    
+    def test_console_approval_banner(self, monkeypatch, capsys):
+        """Console approval should show the request and parse the answer."""
+        store = ApprovalStore()
+        request = ApprovalRequest(
+            request_id="patch_123",
+            kind="patch",
+            summary="Fix bug",
+            details="--- a/foo.py\n+++ b/foo.py",
+            source_file="foo.py",
+        )
+        monkeypatch.setattr("builtins.input", lambda prompt: "y")
+        
+        approval = store._console_approval(request)
+        out = capsys.readouterr().out
+        
+        assert approval.approved is True
+        assert "🔧 PATCH APPROVAL REQUEST" in out
+        assert "ID: patch_123" in out
+        assert "File: foo.py" in out
+        assert "--- a/foo.py" in out
 
 
 class TestGlobalApprovalStore:
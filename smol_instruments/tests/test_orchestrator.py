@@ -0,0 +1,281 @@
+"""Tests for gate tracking in the orchestrator."""
+
+import pytest
+from agent_runtime.state import AgentState
+from agent_runtime.orchestrator import (
+    GateTracker,
+    _task_hint,
+    gate_aware_step_callback,
+    try_inject_message,
+    try_inject_warning,
+)
+
+
+class TestGateTracker:
+    """Test GateTracker evidence evaluation."""
+
+    def test_initial_status(self):
+        """Fresh tracker should report no gates passed."""
+        tracker = GateTracker(AgentState(task="Test"))
+
+        status = tracker.evaluate_gates()
+
+        assert status.steps_taken == 0
+        assert not status.readiness
+        assert not status.no_progress_yet
+
+    def test_evidence_accumulates_across_evaluations(self):
+        """Steps added between evaluations should be picked up."""
+        state = AgentState(task="Test")
+        tracker = GateTracker(state)
+
+        state.add_step("rg_search", {"pattern": "foo"}, {"matches": []})
+        status = tracker.evaluate_gates()
+        assert status.search_used
+        assert not status.understanding
+
+        state.add_step("read_file", {"path": "foo.py"}, {"lines": "content"})
+        status = tracker.evaluate_gates()
+        assert status.steps_taken == 2
+        assert status.understanding
+
+    def test_no_progress_detected(self):
+        """Only discovery tools should flag no progress."""
+        state = AgentState(task="Test")
+        tracker = GateTracker(state)
+
+        state.add_step("repo_info", {}, {"root": "."})
+        state.add_step("list_files", {"glob": "*"}, {"files": []})
+
+        assert tracker.evaluate_gates().no_progress_yet
+
+    def test_cleared_steps_reset_evidence(self):
+        """Clearing steps for a new task should drop cached evidence."""
+        state = AgentState(task="Test")
+        tracker = GateTracker(state)
+
+        state.add_step("rg_search", {"pattern": "foo"}, {"matches": []})
+        state.add_step("read_file", {"path": "foo.py"}, {"lines": "content"})
+        assert tracker.evaluate_gates().search_used
+
+        state.steps.clear()
+        state.add_step("repo_info", {}, {"root": "."})
+        status = tracker.evaluate_gates()
+
+        assert status.steps_taken == 1
+        assert not status.search_used
+
+    def test_new_task_with_more_steps_resets_evidence(self):
+        """A new task reaching the old step count before evaluation should not reuse evidence."""
+        state = AgentState(task="First task")
+        tracker = GateTracker(state)
+
+        state.add_step("rg_search", {"pattern": "foo"}, {"matches": []})
+        state.add_step("read_file", {"path": "foo.py"}, {"lines": "content"})
+        assert tracker.evaluate_gates().search_used
+
+        # Same task text, steps replaced by at least as many new ones
+        state.steps.clear()
+        for _ in range(3):
+            state.add_step("list_files", {"glob": "*"}, {"files": []})
+        status = tracker.evaluate_gates()
+
+        assert not status.search_used
+        assert status.no_progress_yet
+
+        # New task text, same step count
+        state.steps.clear()
+        state.task = "Second task"
+        state.add_step("rg_search", {"pattern": "bar"}, {"matches": []})
+        state.add_step("list_files", {"glob": "*"}, {"files": []})
+        state.add_step("list_files", {"glob": "*"}, {"files": []})
+        status = tracker.evaluate_gates()
+
+        assert status.search_used
+        assert not status.no_progress_yet
+
+    def test_full_readiness(self):
+        """Search, read, patch and verify should satisfy all gates."""
+        state = AgentState(task="Test")
+        tracker = GateTracker(state)
+
+        state.add_step("rg_search", {"pattern": "foo"}, {"matches": []})
+        state.add_step("read_file", {"path": "foo.py"}, {"lines": "content"})
+        state.add_step("propose_patch_unified", {"intent": "fix"}, {"patch_id": "patch_1"})
+        state.add_step("run_tests", {"test_cmd": "pytest -q"}, {"exit": 0})
+
+        status = tracker.evaluate_gates()
+
+        assert status.all_passed()
+        assert status.readiness
+
+    def test_readiness_is_sealed(self):
+        """Once ready, later evaluations reuse the status with fresh step count."""
+        state = AgentState(task="Test")
+        tracker = GateTracker(state)
+
+        state.add_step("rg_search", {"pattern": "foo"}, {"matches": []})
+        state.add_step("read_file", {"path": "foo.py"}, {"lines": "content"})
+        state.add_step("propose_patch_unified", {"intent": "fix"}, {"patch_id": "patch_1"})
+        state.add_step("run_tests", {"test_cmd": "pytest -q"}, {"exit": 0})
+        first = tracker.evaluate_gates()
+        assert tracker.readiness_reached
+
+        state.add_step("git_status", {}, {"status": ""})
+        second = tracker.evaluate_gates()
+
+        assert second.readiness
+        assert second.steps_taken == 5
+        assert first.steps_taken == 4  # Earlier results are not mutated
+        assert tracker.get_warning_message(second) is None
+
+        state.steps.clear()
+        assert not tracker.readiness_reached
+        assert not tracker.evaluate_gates().readiness
+
+    def test_sealed_readiness_dropped_for_new_task(self):
+        """A new task after readiness should get no-progress warnings again."""
+        state = AgentState(task="Test")
+        tracker = GateTracker(state)
+
+        state.add_step("rg_search", {"pattern": "foo"}, {"matches": []})
+        state.add_step("read_file", {"path": "foo.py"}, {"lines": "content"})
+        state.add_step("propose_patch_unified", {"intent": "fix"}, {"patch_id": "patch_1"})
+        state.add_step("run_tests", {"test_cmd": "pytest -q"}, {"exit": 0})
+        assert tracker.evaluate_gates().readiness
+
+        state.steps.clear()
+        for _ in range(7):
+            state.add_step("list_files", {"glob": "*"}, {"files": []})
+
+        assert not tracker.readiness_reached
+        status = tracker.evaluate_gates()
+        assert not status.readiness
+        assert status.no_progress_yet
+        assert tracker.get_warning_message(status).startswith("🚫 CRITICAL (step 7)")
+
+    def test_critical_warning_task_hint(self):
+        """Stuck warning should suggest a search matching the task."""
+        state = AgentState(task="Fix the failing test after the Phoenix change")
+        tracker = GateTracker(state)
+
+        for _ in range(GateTracker.MAX_NO_PROGRESS_STEPS):
+            state.add_step("list_files", {"glob": "*"}, {"files": []})
+        status = tracker.evaluate_gates()
+        warning = tracker.get_warning_message(status)
+
+        assert warning.startswith("🚫 CRITICAL (step 6)")
+        assert "rg_search(pattern='phoenix|trace|span')" in warning
+
+    def test_task_hint_ignores_unicode_case_folding(self):
+        """Non-ASCII look-alikes should not match hint keywords (or raise)."""
+        for task in ["Fix the teſt suite", "add tracıng", "phoenİx spans"]:
+            state = AgentState(task=task)
+            tracker = GateTracker(state)
+            for _ in range(GateTracker.MAX_NO_PROGRESS_STEPS):
+                state.add_step("list_files", {"glob": "*"}, {"files": []})
+
+            warning = tracker.get_warning_message(tracker.evaluate_gates())
+
+            assert "Suggested:" not in warning
+
+        assert _task_hint("Run the TEST suite") == _task_hint("run the test suite") != ""
+
+
+class TestWarningInjection:
+    """Test message injection into agent memory."""
+
+    def test_inject_into_memory_list(self):
+        """Messages should be appended to a list-backed memory."""
+        agent = type("Agent", (), {})()
+        agent.memory = []
+
+        assert try_inject_warning(agent, "first")
+        assert try_inject_warning(agent, "second")
+
+        assert agent.memory == [
+            {"role": "system", "content": "first"},
+            {"role": "system", "content": "second"},
+        ]
+
+    def test_fallback_to_logs(self):
+        """Logs list should be used when memory is not a list."""
+        agent = type("Agent", (), {})()
+        agent.memory = object()
+        agent.logs = []
+
+        assert try_inject_message(agent, "hint", role="user")
+        assert agent.logs == [{"role": "user", "content": "hint"}]
+
+    def test_no_sink(self):
+        """Agents without a list sink should report failed injection."""
+        agent = type("Agent", (), {})()
+
+        assert not try_inject_warning(agent, "lost")
+        assert not try_inject_warning(agent, "lost again")
+
+
+class TestGateAwareStepCallback:
+    """Test the step callback wiring."""
+
+    def test_agent_without_state_is_skipped(self):
+        """Agents without attached state should be marked as not gated."""
+        agent = type("Agent", (), {})()
+        step = type("Step", (), {"error": None})()
+
+        gate_aware_step_callback(step, agent)
+        gate_aware_step_callback(step, agent)
+
+        assert agent._gate_enabled is False
+        assert not hasattr(agent, "_gate_tracker")
+
+    def test_tracker_created_and_warning_injected(self):
+        """Attached state should get a tracker and warnings in memory."""
+        state = AgentState(task="Test")
+        agent = type("Agent", (), {})()
+        agent._smol_state = state
+        agent.memory = []
+        step = type("Step", (), {"error": None})()
+
+        state.add_step("repo_info", {}, {"root": "."})
+        state.add_step("list_files", {"glob": "*"}, {"files": []})
+        gate_aware_step_callback(step, agent)
+
+        assert isinstance(agent._gate_tracker, GateTracker)
+        assert len(agent.memory) == 1
+        assert "not made progress" in agent.memory[0]["content"]
+
+    def test_warning_banner_printed(self, capsys):
+        """Console banner should frame the warning text."""
+        state = AgentState(task="Test")
+        agent = type("Agent", (), {})()
+        agent._smol_state = state
+        step = type("Step", (), {"error": None})()
+
+        state.add_step("repo_info", {}, {"root": "."})
+        state.add_step("list_files", {"glob": "*"}, {"files": []})
+        gate_aware_step_callback(step, agent)
+
+        out = capsys.readouterr().out
+        assert out.startswith("\n" + "=" * 70 + "\n⚠ GATE WARNING (injection failed")
+        assert "not made progress" in out
+        assert out.endswith("=" * 70 + "\n\n")
+
+    def test_parsing_error_banner_printed(self, capsys):
+        """Parsing errors should inject recovery guidance and print a banner."""
+        agent = type("Agent", (), {})()
+        agent._smol_state = AgentState(task="Fix bug")
+        agent.memory = []
+        step = type("Step", (), {
+            "error": "Error while parsing tool call: missing key 'name'",
+            "model_output": "{bad json",
+        })()
+
+        gate_aware_step_callback(step, agent)
+
+        out = capsys.readouterr().out
+        assert agent.memory[0]["role"] == "user"
+        assert "PARSING ERROR DETECTED" in out
+        assert "Task: Fix bug" in out
+        assert "✓ Recovery guidance injected" in out
+        assert not hasattr(agent, "_gate_tracker")
@@ -8,6 +8,7 @@ from pathlib import Path
 from agent_runtime.tools.repo import RepoInfoTool, ListFilesTool
 from agent_runtime.tools.files import ReadFileTool, ReadFileSnippetTool
 from agent_runtime.tools.git import GitStatusTool, GitDiffTool, GitLogTool
+from agent_runtime.tools.patch import ProposePatchUnifiedTool, ApplyPatchTool
 from agent_runtime.approval import ApprovalStore, Approval, set_approval_store
 
 
@@ -291,6 +292,55 @@ class TestGitTools:
         assert diff1 == diff2
 
 
+class TestPatchTools:
+    """Test patch proposal tools."""
+    
+    def test_propose_extracts_prefixed_path(self, test_repo, approval_store):
+        """Should take the path after a/ from the first --- header."""
+        diff = "--- a/src/main.py\r\n+++ b/src/main.py\r\n@@ -1 +1 @@\r\n-x\r\n+y\r\n"
+        
+        result = ProposePatchUnifiedTool().forward(intent="fix", unified_diff=diff)
+        
+        assert result["file_path"] == "src/main.py"
+        assert result["approved"]
+    
+    def test_propose_extracts_bare_path(self, test_repo, approval_store):
+        """Should take the first token when the header has no a/ prefix."""
+        diff = "diff header\n--- src/main.py\t2024-01-01\n+++ src/main.py\n@@ -1 +1 @@\n"
+        
+        result = ProposePatchUnifiedTool().forward(intent="fix", unified_diff=diff)
+        
+        assert result["file_path"] == "src/main.py"
+    
+    def test_propose_rejects_diff_without_header(self, test_repo, approval_store):
+        """Diffs without a --- header should be reported as invalid."""
+        result = ProposePatchUnifiedTool().forward(intent="fix", unified_diff="@@ -1 +1 @@\n-x\n+y\n")
+        
+        assert result["error"] == "INVALID_DIFF"
+    
+    def test_apply_approved_patch(self, test_repo, approval_store):
+        """Approved patch should be validated and applied to the repo."""
+        diff = "--- a/README.md\n+++ b/README.md\n@@ -1 +1 @@\n-# Test Repo\n+# Patched Repo\n"
+        proposed = ProposePatchUnifiedTool().forward(intent="rename", unified_diff=diff)
+        
+        result = ApplyPatchTool().forward(patch_id=proposed["patch_id"])
+        
+        assert result["ok"]
+        assert (test_repo / "README.md").read_text() == "# Patched Repo\n"
+        assert not list(test_repo.glob(".patch_*.diff"))
+    
+    def test_apply_stale_patch_fails_validation(self, test_repo, approval_store):
+        """Patch that no longer matches the file should fail sandbox validation."""
+        diff = "--- a/README.md\n+++ b/README.md\n@@ -1 +1 @@\n-# Other\n+# Patched Repo\n"
+        proposed = ProposePatchUnifiedTool().forward(intent="rename", unified_diff=diff)
+        
+        result = ApplyPatchTool().forward(patch_id=proposed["patch_id"])
+        
+        assert result["error"] == "PATCH_APPLY_FAILED"
+        assert "Patch validation failed" in result["message"]
+        assert (test_repo / "README.md").read_text() == "# Test Repo\n"
+
+
 class TestToolErrorHandling:
     """Test error handling across all tools."""
     